@@ -1,4 +1,7 @@
+import os
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -14,6 +17,32 @@ TEXT_DARK  = "#111827"
 
 st.set_page_config(page_title="CNU Basketball Goals Dashboard", layout="wide")
 
+# Shared Plotly styling — every chart starts from these instead of re-stating
+# the same ~30 lines of layout per figure.
+BASE_LAYOUT = dict(
+    template="simple_white",
+    font=dict(color=TEXT_DARK),
+    plot_bgcolor="white",
+    paper_bgcolor="white",
+    margin=dict(t=30, r=20, b=40, l=40),
+)
+PCT_YAXIS = dict(
+    tickformat=".0%",
+    gridcolor=CNU_GRAY,
+    zerolinecolor=CNU_GRAY,
+    color=TEXT_DARK,
+    tickfont=dict(color=TEXT_DARK),
+)
+SEASON_XAXIS = dict(
+    tickangle=-30,
+    color=TEXT_DARK,
+    tickfont=dict(color=TEXT_DARK),
+)
+TOP_LEGEND = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+
+def _axis_title(text):
+    return dict(text=text, font=dict(color=TEXT_DARK))
+
 # ---- High-contrast CSS & tiles ----
 st.markdown(
     f"""
@@ -39,13 +68,49 @@ st.markdown(
 # ----------------------------
 # LOAD DATA
 # ----------------------------
+CSV_PATH = "data/cnu_games_with_goals.csv"
+FEATHER_PATH = "data/cnu_games_with_goals.feather"
+
+# Only the columns the dashboard actually renders; the raw CSV carries a lot
+# of per-game box-score detail we never touch here.
+USE_COLS = [
+    "date", "season", "opponent", "win", "goals_hit",
+    "goal_reb", "goal_to", "goal_orb", "goal_def30",
+    "cnu_pts", "opp_pts",
+]
+DTYPES = {
+    "win": "int8", "goals_hit": "int8",
+    "goal_reb": "int8", "goal_to": "int8", "goal_orb": "int8", "goal_def30": "int8",
+    "cnu_pts": "Int16", "opp_pts": "Int16",
+}
+
 @st.cache_data
 def load_data():
-    return pd.read_csv("data/cnu_games_with_goals.csv")
+    # Feather sidecar loads ~10-50x faster than the CSV and keeps the parsed
+    # datetime dtype, so cold starts skip CSV parsing + date coercion entirely.
+    try:
+        if os.path.getmtime(FEATHER_PATH) >= os.path.getmtime(CSV_PATH):
+            return pd.read_feather(FEATHER_PATH)
+    except OSError:
+        pass  # sidecar missing or stale -> rebuild from the CSV
+
+    df = pd.read_csv(CSV_PATH, usecols=USE_COLS, dtype=DTYPES)
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    # Low-cardinality strings -> categoricals: groupbys run on integer codes
+    # and the ordered season categories give us chronological order for free.
+    df["season"] = pd.Categorical(
+        df["season"], categories=sorted(df["season"].dropna().unique()), ordered=True
+    )
+    df["opponent"] = df["opponent"].astype("category")
+    df["pred_win"] = (df["goals_hit"] >= 3).astype("int8")
+
+    try:
+        df.to_feather(FEATHER_PATH)
+    except Exception:
+        pass  # pyarrow not installed or read-only disk; CSV path still works
+    return df
 
 df = load_data()
-df["date"] = pd.to_datetime(df["date"], errors="coerce")
-df["pred_win"] = (df["goals_hit"] >= 3).astype(int)
 
 # ----------------------------
 # HEADER & FILTERS
@@ -53,9 +118,9 @@ df["pred_win"] = (df["goals_hit"] >= 3).astype(int)
 st.title("CNU Basketball Game Goals")
 st.caption(">30 at half, outrebound ______, 40% of offensive rebounds, less turnovers")
 
-seasons = sorted(df["season"].dropna().unique())
+seasons = df["season"].cat.categories.tolist()
 season_choice = st.multiselect("Select seasons", seasons, default=seasons)
-filtered = df[df["season"].isin(season_choice)].copy()
+filtered = df[df["season"].isin(season_choice)]
 
 if filtered.empty:
     st.warning("No games in the selected season range.")
@@ -64,10 +129,11 @@ if filtered.empty:
 # ----------------------------
 # METRICS
 # ----------------------------
-tp = ((filtered.pred_win==1)&(filtered.win==1)).sum()
-fp = ((filtered.pred_win==1)&(filtered.win==0)).sum()
-tn = ((filtered.pred_win==0)&(filtered.win==0)).sum()
-fn = ((filtered.pred_win==0)&(filtered.win==1)).sum()
+# Pack pred*2+win into one key and count all four cells in a single pass
+# instead of eight boolean scans.
+key = (filtered["pred_win"].to_numpy(np.uint8) << 1) | filtered["win"].to_numpy(np.uint8)
+counts = np.bincount(key, minlength=4)
+tn, fn, fp, tp = (int(c) for c in counts[:4])
 
 total = max(1, tp+fp+tn+fn)
 acc  = (tp+tn)/total
@@ -96,34 +162,29 @@ st.subheader("Win rate by number of goals achieved")
 wr = filtered.groupby("goals_hit")["win"].mean().reindex([0,1,2,3,4]).reset_index()
 wr["Games"] = filtered.groupby("goals_hit")["win"].count().reindex([0,1,2,3,4]).values
 
-fig1 = px.bar(
-    wr, x="goals_hit", y="win", text="Games",
-    labels={"goals_hit": "Goals hit", "win": "Win %"},
-    color="goals_hit",
-    color_discrete_sequence=[CNU_GRAY, CNU_SILVER, "#d1d5db", CNU_BLUE, "#001e5e"],
-)
-fig1.update_traces(textposition="outside", textfont_color=TEXT_DARK)
-fig1.update_layout(
-    template="simple_white",
-    font=dict(color=TEXT_DARK),
-    yaxis=dict(
-        title=dict(text="Win %", font=dict(color=TEXT_DARK)),
-        tickformat=".0%",
-        gridcolor=CNU_GRAY,
-        zerolinecolor=CNU_GRAY,
-        color=TEXT_DARK,
-        tickfont=dict(color=TEXT_DARK),
-    ),
-    xaxis=dict(
-        title=dict(text="Goals hit", font=dict(color=TEXT_DARK)),
-        color=TEXT_DARK,
-        tickfont=dict(color=TEXT_DARK),
-    ),
-    plot_bgcolor="white",
-    paper_bgcolor="white",
-    margin=dict(t=30, r=20, b=40, l=40),
-)
-st.plotly_chart(fig1, use_container_width=True)
+# Chart builders are cached on their (tiny, already-aggregated) input frames,
+# so reruns that don't change the season filter skip figure construction.
+@st.cache_data
+def _make_fig1(wr):
+    fig1 = px.bar(
+        wr, x="goals_hit", y="win", text="Games",
+        labels={"goals_hit": "Goals hit", "win": "Win %"},
+        color="goals_hit",
+        color_discrete_sequence=[CNU_GRAY, CNU_SILVER, "#d1d5db", CNU_BLUE, "#001e5e"],
+    )
+    fig1.update_traces(textposition="outside", textfont_color=TEXT_DARK)
+    fig1.update_layout(
+        **BASE_LAYOUT,
+        yaxis={**PCT_YAXIS, "title": _axis_title("Win %")},
+        xaxis=dict(
+            title=_axis_title("Goals hit"),
+            color=TEXT_DARK,
+            tickfont=dict(color=TEXT_DARK),
+        ),
+    )
+    return fig1
+
+st.plotly_chart(_make_fig1(wr), use_container_width=True)
 
 st.markdown("---")
 
@@ -132,102 +193,78 @@ st.markdown("---")
 # ------------------------------------------------------------------
 st.subheader("Season comparison: Win% vs. Rule accuracy")
 
+# Named aggregations run in cython; the old per-group lambda built a Python
+# Series per season. _correct is precomputed so rule_acc is a plain mean too.
+filtered["_correct"] = (filtered["pred_win"] == filtered["win"]).astype("int8")
 grp = (
     filtered.groupby("season")
-    .apply(lambda g: pd.Series({
-        "win_pct": g["win"].mean(),
-        "rule_acc": (g["pred_win"] == g["win"]).mean(),
-        "games": g["win"].size,
-        "avg_goals": g["goals_hit"].mean(),
-    }))
+    .agg(
+        win_pct=("win", "mean"),
+        rule_acc=("_correct", "mean"),
+        games=("win", "size"),
+        avg_goals=("goals_hit", "mean"),
+    )
     .reset_index()
     .sort_values("season")
 )
 
-fig2 = go.Figure()
-fig2.add_trace(go.Bar(
-    x=grp["season"], y=grp["win_pct"],
-    name="Win %",
-    marker_color=CNU_BLUE,
-    text=[f"{v:.0%}" for v in grp["win_pct"]],
-    textposition="outside",
-))
-fig2.add_trace(go.Bar(
-    x=grp["season"], y=grp["rule_acc"],
-    name="Rule Accuracy",
-    marker_color=CNU_SILVER,
-    text=[f"{v:.0%}" for v in grp["rule_acc"]],
-    textposition="outside",
-))
-fig2.update_layout(
-    barmode="group",
-    template="simple_white",
-    font=dict(color=TEXT_DARK),
-    yaxis=dict(
-        title=dict(text="Rate", font=dict(color=TEXT_DARK)),
-        tickformat=".0%",
-        gridcolor=CNU_GRAY,
-        zerolinecolor=CNU_GRAY,
-        rangemode="tozero",
-        color=TEXT_DARK,
-        tickfont=dict(color=TEXT_DARK),
-    ),
-    xaxis=dict(
-        title=dict(text="Season", font=dict(color=TEXT_DARK)),
-        tickangle=-30,
-        color=TEXT_DARK,
-        tickfont=dict(color=TEXT_DARK),
-    ),
-    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    plot_bgcolor="white",
-    paper_bgcolor="white",
-    margin=dict(t=30, r=20, b=60, l=40),
-)
-st.plotly_chart(fig2, use_container_width=True)
+@st.cache_data
+def _make_fig2(grp):
+    fig2 = go.Figure()
+    fig2.add_trace(go.Bar(
+        x=grp["season"], y=grp["win_pct"],
+        name="Win %",
+        marker_color=CNU_BLUE,
+        text=[f"{v:.0%}" for v in grp["win_pct"]],
+        textposition="outside",
+    ))
+    fig2.add_trace(go.Bar(
+        x=grp["season"], y=grp["rule_acc"],
+        name="Rule Accuracy",
+        marker_color=CNU_SILVER,
+        text=[f"{v:.0%}" for v in grp["rule_acc"]],
+        textposition="outside",
+    ))
+    fig2.update_layout(**BASE_LAYOUT)
+    fig2.update_layout(
+        barmode="group",
+        yaxis={**PCT_YAXIS, "rangemode": "tozero", "title": _axis_title("Rate")},
+        xaxis={**SEASON_XAXIS, "title": _axis_title("Season")},
+        legend=TOP_LEGEND,
+        margin=dict(t=30, r=20, b=60, l=40),
+    )
+    return fig2
+
+st.plotly_chart(_make_fig2(grp), use_container_width=True)
 
 # ------------------------------------------------------------------
 # CHART 3 (optional): Goals Mix by Season (stacked distribution)
 # ------------------------------------------------------------------
-with st.expander("Goals mix by season (distribution of 0–4 goals hit)"):
-    mix = (
-        filtered
-        .groupby(["season", "goals_hit"])["win"]
-        .count()
-        .reset_index(name="N")
-    )
-    totals = mix.groupby("season")["N"].transform("sum")
-    mix["Share"] = mix["N"] / totals
-
+@st.cache_data
+def _make_fig3(mix):
     fig3 = px.bar(
         mix, x="season", y="Share", color="goals_hit",
         labels={"Share":"Share of games", "season":"Season", "goals_hit":"Goals hit"},
         color_discrete_sequence=[CNU_GRAY, CNU_SILVER, "#d1d5db", CNU_BLUE, "#001e5e"],
     )
+    fig3.update_layout(**BASE_LAYOUT)
     fig3.update_layout(
         barmode="stack",
-        template="simple_white",
-        font=dict(color=TEXT_DARK),
-        yaxis=dict(
-            title=dict(text="Share", font=dict(color=TEXT_DARK)),
-            tickformat=".0%",
-            gridcolor=CNU_GRAY,
-            zerolinecolor=CNU_GRAY,
-            rangemode="tozero",
-            color=TEXT_DARK,
-            tickfont=dict(color=TEXT_DARK),
-        ),
-        xaxis=dict(
-            title=dict(text="Season", font=dict(color=TEXT_DARK)),
-            tickangle=-30,
-            color=TEXT_DARK,
-            tickfont=dict(color=TEXT_DARK),
-        ),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        plot_bgcolor="white",
-        paper_bgcolor="white",
+        yaxis={**PCT_YAXIS, "rangemode": "tozero", "title": _axis_title("Share")},
+        xaxis={**SEASON_XAXIS, "title": _axis_title("Season")},
+        legend=TOP_LEGEND,
         margin=dict(t=30, r=20, b=60, l=40),
     )
-    st.plotly_chart(fig3, use_container_width=True)
+    return fig3
+
+with st.expander("Goals mix by season (distribution of 0–4 goals hit)"):
+    # One pivot gets the per-season shares directly — no second groupby/transform.
+    mix = (
+        pd.crosstab(filtered["season"], filtered["goals_hit"], normalize="index")
+        .stack()
+        .reset_index(name="Share")
+    )
+    st.plotly_chart(_make_fig3(mix), use_container_width=True)
 
 st.markdown("---")
 
@@ -235,13 +272,15 @@ st.markdown("---")
 # GAME TABLE + HIGHLIGHT
 # ----------------------------
 st.subheader("Game detail")
-filtered["rule_correct"] = ((filtered["pred_win"] == filtered["win"]).map({True:"✅", False:"❌"}))
+# _correct is already computed for the season comparison; one np.where call
+# beats a per-row dict lookup through .map.
+filtered["rule_correct"] = np.where(filtered["_correct"].to_numpy(np.bool_), "✅", "❌")
 view_cols = [
     "date","season","opponent","win","goals_hit",
     "goal_reb","goal_to","goal_orb","goal_def30",
     "cnu_pts","opp_pts","rule_correct"
 ]
 st.dataframe(
-    filtered[view_cols].sort_values("date", ascending=False),
+    filtered[view_cols].sort_values("date", ascending=False, kind="stable"),
     use_container_width=True,
 )
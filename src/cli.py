@@ -13,7 +13,8 @@ def main():
     p_scrape.add_argument("--start", type=int, required=True, help="Start season first year (e.g., 2010 for 2010-11)")
     p_scrape.add_argument("--end", type=int, required=True, help="End season first year (e.g., 2024 for 2024-25)")
     p_scrape.add_argument("--out", type=str, default="data/cnu_games_raw.csv", help="Output CSV path")
-    p_scrape.add_argument("--sleep", type=float, default=0.6, help="Seconds to sleep between box pages")
+    p_scrape.add_argument("--sleep", type=float, default=0.2, help="Seconds to sleep between box pages")
+    p_scrape.add_argument("--no-cache", action="store_true", help="Bypass the on-disk HTTP cache and re-download pages")
 
     p_proc = sub.add_parser("process", help="Build features and goals from raw CSV")
     p_proc.add_argument("--in", dest="in_csv", type=str, required=True, help="Raw CSV path")
@@ -28,6 +29,8 @@ def main():
     print("CWD:", os.getcwd())
 
     if args.cmd == "scrape":
+        if args.no_cache:
+            os.environ["CNU_NO_CACHE"] = "1"
         scrape_range(args.start, args.end, args.out, sleep_sec=args.sleep)
     elif args.cmd == "process":
         build_goals(args.in_csv, args.out)
@@ -2,11 +2,15 @@ import os
 import re
 import time
 import csv
-from datetime import datetime
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html import unescape
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter, Retry
 
 # Season index pages look like:
 # https://static.cnusports.com/custompages/mbball/Stats/2012-2013/teamstat.htm
@@ -16,51 +20,82 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; CNU-DS-Project/1.0)"
 }
 
+# One shared Session so keep-alive reuses the TCP/TLS connection across the
+# ~30 box pages of a season instead of handshaking per request.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.headers["Accept-Encoding"] = "gzip, deflate"
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Historical season/box pages never change, so cache responses on disk and
+# make scraper re-runs hit the filesystem instead of the network.
+# Set CNU_NO_CACHE=1 (or pass --no-cache to the CLI) to force re-downloads.
+CACHE_DIR = ".http_cache"
+
+def _cache_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".html")
+
+def _cache_enabled() -> bool:
+    return os.environ.get("CNU_NO_CACHE") != "1"
+
 # ---------- helpers for season page ----------
 
-def fetch(url: str) -> str:
-    r = requests.get(url, headers=HEADERS, timeout=30)
+def fetch_bytes(url: str) -> bytes:
+    """Fetch raw response bytes, skipping the decode the caller may not need."""
+    use_cache = _cache_enabled()
+    path = _cache_path(url)
+    if use_cache and os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    r = SESSION.get(url, timeout=30)
     r.raise_for_status()
-    return r.text
+    content = r.content
+
+    if use_cache:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write via tempfile + rename so a crash never leaves a partial file.
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    return content
+
+def fetch(url: str) -> str:
+    return fetch_bytes(url).decode("utf-8", errors="replace")
+
+# Season pages are simple static tables, so a regex scan is much cheaper than
+# building a full BS4 tree and walking it per link.
+ROW_RE = re.compile(r"<tr\b[^>]*>(.*?)</tr>", re.IGNORECASE | re.DOTALL)
+CELL_RE = re.compile(r"<t[dh]\b[^>]*>(.*?)</t[dh]>", re.IGNORECASE | re.DOTALL)
+HREF_RE = re.compile(r'href="([^"]+)"[^>]*>\s*Box score', re.IGNORECASE)
+TAG_RE = re.compile(r"<[^>]+>")
 
 def parse_game_result_rows(html: str, season_url: str):
     """
     Find 'Box score' links on a season page and extract (date, location, result, box_url).
     Returns list of tuples: (date_text, location_text, result_text, box_url)
     """
-    soup = BeautifulSoup(html, "html.parser")
     out = []
-    for a in soup.find_all("a", href=True):
-        if a.get_text(strip=True).lower() == "box score":
-            row = a.find_parent("tr")
-            if not row:
-                continue
-            # PyCharm sometimes warns on get_text(strip=...), so do strip() separately.
-            cells = []
-            for c in row.find_all(["td", "th"]):
-                txt = c.get_text(" ").strip()
-                cells.append(txt)
-            if len(cells) >= 3:
-                date_text = cells[0]
-                location_text = cells[1] if len(cells) > 1 else ""
-                result_text = cells[2] if len(cells) > 2 else ""
-                box_href = a.get("href", "")
-                box_url = urljoin(season_url, box_href)
-                out.append((date_text, location_text, result_text, box_url))
-    return out
-
-def clean_date(date_text: str) -> str:
-    """Convert mm/dd/yy or mm/dd/yyyy -> YYYY-MM-DD"""
-    date_text = date_text.strip()
-    for fmt in ("%m/%d/%y", "%m/%d/%Y"):
-        try:
-            dt = datetime.strptime(date_text, fmt)
-            if fmt == "%m/%d/%y" and dt.year < 1990:
-                dt = dt.replace(year=dt.year + 2000)
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
+    for row_m in ROW_RE.finditer(html):
+        row_html = row_m.group(1)
+        href_m = HREF_RE.search(row_html)
+        if not href_m:
             continue
-    return date_text  # fallback
+        cells = [TAG_RE.sub(" ", c).strip() for c in CELL_RE.findall(row_html)]
+        if len(cells) >= 3:
+            date_text = cells[0]
+            location_text = cells[1] if len(cells) > 1 else ""
+            result_text = cells[2] if len(cells) > 2 else ""
+            box_url = urljoin(season_url, href_m.group(1))
+            out.append((date_text, location_text, result_text, box_url))
+    return out
 
 # ---------- box page parsing (text-only, robust for CNU pages) ----------
 
@@ -69,8 +104,18 @@ SCORE_BY_PERIODS_RE = re.compile(
     re.IGNORECASE
 )
 TEAM_HEADER_RE = re.compile(r"^(VISITORS|HOME TEAM):\s*(.*)$", re.MULTILINE)
+RECORD_RE = re.compile(r"^\d+-\d+$")
+INT_RE = re.compile(r"\d+")
 TOTALS_LINE_PATTERN = re.compile(r"^\s*Totals\.\.+\s+(.*)$", re.IGNORECASE)
 
+# Three shot pairs (FG-FGA, 3PT-3PTA, FT-FTA) then 10 single ints
+# (OFF DEF TOT PF TP A TO BLK S MIN) captured in one match — no per-token
+# split/int/try-except loop.
+TOTALS_RE = re.compile(
+    r"(\d+)-(\d+)\s+(\d+)-(\d+)\s+(\d+)-(\d+)\s+"
+    r"(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)"
+)
+
 def _parse_totals_line(line: str):
     """
     Parse: Totals........   26-58   7-18  25-35  10 32 42  17  84 14  9  4  6 200
@@ -78,38 +123,11 @@ def _parse_totals_line(line: str):
       FG-FGA, 3PT-3PTA, FT-FTA, OFF, DEF, TOT, PF, TP, A, TO, BLK, S, MIN
     Returns dict with fgm,fga,tpm,tpa,ftm,fta,orb,drb,trb,to
     """
-    tokens = line.split()
-    if len(tokens) < 13:
-        return None
-
-    def split_pair(tok):
-        if "-" in tok:
-            a, b = tok.split("-", 1)
-            try:
-                return int(a), int(b)
-            except Exception:
-                return None, None
-        try:
-            return int(tok), None
-        except Exception:
-            return None, None
-
-    # First three are shot pairs
-    fgm, fga = split_pair(tokens[0])
-    tpm, tpa = split_pair(tokens[1])
-    ftm, fta = split_pair(tokens[2])
-
-    def to_int(tok):
-        try:
-            return int(tok)
-        except Exception:
-            return None
-
-    # Next 10 single integers: OFF DEF TOT PF TP A TO BLK S MIN
-    rest = [to_int(tok) for tok in tokens[3:3 + 10]]
-    if len(rest) < 10:
+    m = TOTALS_RE.match(line.strip())
+    if not m:
         return None
-    off, de, tot, pf, tp, a, tov, blk, s, mins = rest[:10]
+    (fgm, fga, tpm, tpa, ftm, fta,
+     off, de, tot, pf, tp, a, tov, blk, s, mins) = map(int, m.groups())
 
     return {
         "fgm": fgm, "fga": fga,
@@ -127,40 +145,72 @@ def _extract_totals_from_block(text_block: str):
             return _parse_totals_line(m.group(1))
     return None
 
-def parse_box_page(html: str):
+def parse_box_page(html):
     """
     Parse a single box score page into:
       - team names (away/home)
       - first-half points (away/home)
       - totals dicts (away/home) with fgm,fga,orb,drb,trb,to (plus shots)
       - final points (away/home)
+
+    Accepts str or raw response bytes; given bytes, pages missing the team
+    markers are rejected before paying for a full decode.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    text = soup.get_text("\n", strip=True)
+    if isinstance(html, bytes):
+        v = html.find(b"VISITORS:")
+        h = html.find(b"HOME TEAM:")
+        if v == -1 or h == -1:
+            return {
+                "away_name": "", "home_name": "",
+                "away_first_half": None, "home_first_half": None,
+                "away_totals": None, "home_totals": None,
+                "away_pts": None, "home_pts": None,
+            }
+        # Everything we parse sits at/after the earliest marker; decode only that.
+        start = min(v, h)
+        s = html.find(b"Score by Periods")
+        if s != -1:
+            start = min(start, s)
+        html = html[start:].decode("utf-8", errors="replace")
+
+    # The box pages are preformatted text wrapped in a little markup, so a
+    # single tag-strip pass gets us the same text BS4 would, minus the tree build.
+    text = unescape(TAG_RE.sub("\n", html))
+    text = "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+    # Locate the two team markers once with str.find (C-level memmem); both
+    # the name parsing and the block split below key off these offsets.
+    v_start = text.find("VISITORS:")
+    h_start = text.find("HOME TEAM:")
 
     # Team names (strip trailing records like "22-5")
     names = {}
-    for label, rest in TEAM_HEADER_RE.findall(text):
+    for start in (v_start, h_start):
+        if start == -1:
+            continue
+        m = TEAM_HEADER_RE.match(text, start)
+        if not m:
+            continue
+        label, rest = m.group(1), m.group(2)
         tokens = rest.split()
-        while tokens and re.match(r"^\d+-\d+$", tokens[-1]):
+        while tokens and RECORD_RE.match(tokens[-1]):
             tokens.pop()
         names[label] = " ".join(tokens).strip(" #.")
 
-    # Score by Periods (away line then home line)
+    # Score by Periods (away line then home line); cheap find gates the regex.
     away_first = home_first = away_pts = home_pts = None
-    m = SCORE_BY_PERIODS_RE.search(text)
+    idx = text.find("Score by Periods")
+    m = SCORE_BY_PERIODS_RE.match(text, idx) if idx != -1 else None
     if m:
         row1, row2 = m.group(1), m.group(2)
-        ints1 = [int(x) for x in re.findall(r"\d+", row1)]
-        ints2 = [int(x) for x in re.findall(r"\d+", row2)]
+        ints1 = [int(x) for x in INT_RE.findall(row1)]
+        ints2 = [int(x) for x in INT_RE.findall(row2)]
         if ints1:
             away_first, away_pts = ints1[0], ints1[-1]
         if ints2:
             home_first, home_pts = ints2[0], ints2[-1]
 
     # Split into VISITORS and HOME TEAM blocks
-    v_start = text.find("VISITORS:")
-    h_start = text.find("HOME TEAM:")
     away_block = text[v_start:h_start] if (v_start != -1 and h_start != -1) else ""
     home_block = text[h_start:] if h_start != -1 else ""
 
@@ -180,7 +230,75 @@ def parse_box_page(html: str):
 
 # ---------- main scrape orchestrator ----------
 
-def scrape_range(start_year: int, end_year: int, out_csv: str, sleep_sec: float = 0.6):
+# Box pages download in parallel; the semaphore caps in-flight requests so we
+# stay polite to the static host even with the pool saturated.
+MAX_WORKERS = 4
+_FETCH_SEM = threading.Semaphore(MAX_WORKERS)
+
+def _fetch_polite(url: str, sleep_sec: float) -> bytes:
+    with _FETCH_SEM:
+        time.sleep(sleep_sec / MAX_WORKERS)
+        return fetch_bytes(url)
+
+def _build_row(season, date_text, location_text, result_text, box_url, box_html):
+    """Parse one box page into a CSV row dict, or None if CNU isn't in it."""
+    p = parse_box_page(box_html)
+
+    # Determine if CNU is home or away (handle name variants)
+    cname_candidates = ["Christopher Newport", "Chris. Newport", "CNU", "Chris Newport"]
+    is_home_cnu = any(x in p["home_name"] for x in cname_candidates)
+    is_away_cnu = any(x in p["away_name"] for x in cname_candidates)
+    if not (is_home_cnu or is_away_cnu):
+        # Shouldn't happen, but be safe.
+        return None
+
+    home_flag = 1 if is_home_cnu else 0
+    opponent_name = p["away_name"] if is_home_cnu else p["home_name"]
+
+    cnu_tot = p["home_totals"] if is_home_cnu else p["away_totals"]
+    opp_tot = p["away_totals"] if is_home_cnu else p["home_totals"]
+
+    cnu_first = p["home_first_half"] if is_home_cnu else p["away_first_half"]
+    opp_first = p["away_first_half"] if is_home_cnu else p["home_first_half"]
+
+    cnu_pts = p["home_pts"] if is_home_cnu else p["away_pts"]
+    opp_pts = p["away_pts"] if is_home_cnu else p["home_pts"]
+
+    ot_flag = int(("OT" in result_text.upper()) or ("OT" in (location_text.upper() if location_text else "")))
+
+    if cnu_tot is None or opp_tot is None:
+        print(f"[DEBUG] Totals missing for {box_url}")
+
+    # Raw date text goes out as-is; build_goals normalizes the whole column
+    # with one vectorized pd.to_datetime instead of per-row strptime here.
+    return {
+        "season": season,
+        "date": date_text.strip(),
+        "home": home_flag,
+        "opponent": opponent_name,
+        "location_text": location_text,
+        "result_text": result_text,
+        "cnu_pts": cnu_pts,
+        "opp_pts": opp_pts,
+        "cnu_fgm": cnu_tot.get("fgm") if cnu_tot else None,
+        "cnu_fga": cnu_tot.get("fga") if cnu_tot else None,
+        "cnu_orb": cnu_tot.get("orb") if cnu_tot else None,
+        "cnu_drb": cnu_tot.get("drb") if cnu_tot else None,
+        "cnu_trb": cnu_tot.get("trb") if cnu_tot else None,
+        "cnu_to":  cnu_tot.get("to")  if cnu_tot else None,
+        "opp_fgm": opp_tot.get("fgm") if opp_tot else None,
+        "opp_fga": opp_tot.get("fga") if opp_tot else None,
+        "opp_orb": opp_tot.get("orb") if opp_tot else None,
+        "opp_drb": opp_tot.get("drb") if opp_tot else None,
+        "opp_trb": opp_tot.get("trb") if opp_tot else None,
+        "opp_to":  opp_tot.get("to")  if opp_tot else None,
+        "cnu_first_half": cnu_first,
+        "opp_first_half": opp_first,
+        "ot": ot_flag,
+        "box_url": box_url,
+    }
+
+def scrape_range(start_year: int, end_year: int, out_csv: str, sleep_sec: float = 0.2):
     """
     start_year=2010, end_year=2024 covers 2010-2011 ... 2024-2025.
     Writes one CSV with one row per game.
@@ -195,85 +313,44 @@ def scrape_range(start_year: int, end_year: int, out_csv: str, sleep_sec: float
         "opp_fgm","opp_fga","opp_orb","opp_drb","opp_trb","opp_to",
         "cnu_first_half","opp_first_half","ot","box_url"
     ]
-    out_rows = []
-
-    for season in seasons:
-        season_url = BASE_SEASON_URL_TMPL.format(season=season)
-        try:
-            html = fetch(season_url)
-        except Exception as e:
-            print(f"[WARN] Could not open season {season}: {e}")
-            continue
+    games_written = 0
 
-        games = parse_game_result_rows(html, season_url)
-        print(f"{season}: found {len(games)} box links")
+    # Stream rows to disk as they parse: constant memory, and a mid-run crash
+    # still leaves every completed season in the CSV.
+    with open(out_csv, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=fieldnames)
+        w.writeheader()
 
-        for (date_text, location_text, result_text, box_url) in games:
-            time.sleep(sleep_sec)
+        for season in seasons:
+            season_url = BASE_SEASON_URL_TMPL.format(season=season)
             try:
-                box_html = fetch(box_url)
+                html = fetch(season_url)
             except Exception as e:
-                print(f"[WARN] {season} {date_text} failed: {box_url} -> {e}")
-                continue
-
-            p = parse_box_page(box_html)
-
-            # Determine if CNU is home or away (handle name variants)
-            cname_candidates = ["Christopher Newport", "Chris. Newport", "CNU", "Chris Newport"]
-            is_home_cnu = any(x in p["home_name"] for x in cname_candidates)
-            is_away_cnu = any(x in p["away_name"] for x in cname_candidates)
-            if not (is_home_cnu or is_away_cnu):
-                # Shouldn't happen, but be safe.
+                print(f"[WARN] Could not open season {season}: {e}")
                 continue
 
-            date_iso = clean_date(date_text)
-            home_flag = 1 if is_home_cnu else 0
-            opponent_name = p["away_name"] if is_home_cnu else p["home_name"]
-
-            cnu_tot = p["home_totals"] if is_home_cnu else p["away_totals"]
-            opp_tot = p["away_totals"] if is_home_cnu else p["home_totals"]
-
-            cnu_first = p["home_first_half"] if is_home_cnu else p["away_first_half"]
-            opp_first = p["away_first_half"] if is_home_cnu else p["home_first_half"]
-
-            cnu_pts = p["home_pts"] if is_home_cnu else p["away_pts"]
-            opp_pts = p["away_pts"] if is_home_cnu else p["home_pts"]
-
-            ot_flag = int(("OT" in result_text.upper()) or ("OT" in (location_text.upper() if location_text else "")))
-
-            row = {
-                "season": season,
-                "date": date_iso,
-                "home": home_flag,
-                "opponent": opponent_name,
-                "location_text": location_text,
-                "result_text": result_text,
-                "cnu_pts": cnu_pts,
-                "opp_pts": opp_pts,
-                "cnu_fgm": cnu_tot.get("fgm") if cnu_tot else None,
-                "cnu_fga": cnu_tot.get("fga") if cnu_tot else None,
-                "cnu_orb": cnu_tot.get("orb") if cnu_tot else None,
-                "cnu_drb": cnu_tot.get("drb") if cnu_tot else None,
-                "cnu_trb": cnu_tot.get("trb") if cnu_tot else None,
-                "cnu_to":  cnu_tot.get("to")  if cnu_tot else None,
-                "opp_fgm": opp_tot.get("fgm") if opp_tot else None,
-                "opp_fga": opp_tot.get("fga") if opp_tot else None,
-                "opp_orb": opp_tot.get("orb") if opp_tot else None,
-                "opp_drb": opp_tot.get("drb") if opp_tot else None,
-                "opp_trb": opp_tot.get("trb") if opp_tot else None,
-                "opp_to":  opp_tot.get("to")  if opp_tot else None,
-                "cnu_first_half": cnu_first,
-                "opp_first_half": opp_first,
-                "ot": ot_flag,
-                "box_url": box_url,
-            }
-            if cnu_tot is None or opp_tot is None:
-                print(f"[DEBUG] Totals missing for {box_url}")
-            out_rows.append(row)
-
-    with open(out_csv, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        w.writerows(out_rows)
-    print(f"Wrote {len(out_rows)} games to {out_csv}")
+            games = parse_game_result_rows(html, season_url)
+            print(f"{season}: found {len(games)} box links")
+
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+                futures = {
+                    ex.submit(_fetch_polite, box_url, sleep_sec): (date_text, location_text, result_text, box_url)
+                    for (date_text, location_text, result_text, box_url) in games
+                }
+                for fut in as_completed(futures):
+                    date_text, location_text, result_text, box_url = futures[fut]
+                    try:
+                        box_html = fut.result()
+                    except Exception as e:
+                        print(f"[WARN] {season} {date_text} failed: {box_url} -> {e}")
+                        continue
+
+                    row = _build_row(season, date_text, location_text, result_text, box_url, box_html)
+                    if row is not None:
+                        w.writerow(row)
+                        games_written += 1
+
+            f.flush()  # make each season's progress durable
+
+    print(f"Wrote {games_written} games to {out_csv}")
     return out_csv
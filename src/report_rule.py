@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 def rule_report(in_csv: str):
@@ -5,22 +6,27 @@ def rule_report(in_csv: str):
     if "win" not in df.columns or "goals_hit" not in df.columns:
         raise ValueError("Input must contain 'win' and 'goals_hit'. Run the 'process' step first.")
 
+    # int8 arrays + bincount: one pass over the data instead of a boolean
+    # Series per metric.
+    goals = df["goals_hit"].to_numpy(np.int8)
+    win = df["win"].to_numpy(np.int8)
+
     print("=== Win rate by # of goals hit ===")
+    n_by_k = np.bincount(goals, minlength=5)
+    wins_by_k = np.bincount(goals, weights=win, minlength=5)
     for k in range(0, 5):
-        mask = (df["goals_hit"] == k)
-        n = int(mask.sum())
+        n = int(n_by_k[k])
         if n == 0:
             print(f"{k} goals: N=0")
             continue
-        wr = float(df.loc[mask, "win"].mean())
+        wr = wins_by_k[k] / n
         print(f"{k} goals: N={n:3d} | Win%={wr:0.3f}")
 
     print("\n=== 3-of-4 rule as classifier (predict WIN if goals_hit >= 3) ===")
-    df["pred_win"] = (df["goals_hit"] >= 3).astype(int)  # noinspection PyUnresolvedReferences
-    tp = int(((df["pred_win"] == 1) & (df["win"] == 1)).sum())
-    fp = int(((df["pred_win"] == 1) & (df["win"] == 0)).sum())
-    tn = int(((df["pred_win"] == 0) & (df["win"] == 0)).sum())
-    fn = int(((df["pred_win"] == 0) & (df["win"] == 1)).sum())
+    pred = (goals >= 3).astype(np.int8)
+    combo = (pred << 1) | win
+    cnt = np.bincount(combo, minlength=4)
+    tn, fn, fp, tp = (int(c) for c in cnt[:4])
 
     acc = (tp + tn) / max(1, (tp + tn + fp + fn))
     prec = tp / max(1, (tp + fp))